@@ -8,19 +8,27 @@ A comprehensive meeting management platform with:
 """
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 from datetime import datetime, date, time, timedelta
 from collections import defaultdict
 import calendar
+import itertools
+from bisect import bisect_left
+from operator import itemgetter
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 import base64
 
 from database import (
-    init_db, seed_kb_articles,
-    create_meeting, get_all_meetings, get_meeting, update_meeting, delete_meeting,
-    upsert_meeting_notes, get_meeting_notes,
-    add_action_item, get_action_items, update_action_item_status, delete_action_item,
-    save_attachment, get_attachments, get_attachment_data, delete_attachment,
-    add_meeting_url, get_meeting_urls, delete_meeting_url,
-    get_all_kb_articles, add_kb_article, delete_kb_article, update_kb_article,
+    init_db, seed_kb_articles, make_connection_read_only,
+    create_meeting, get_all_meetings, get_upcoming_meetings, get_meeting, update_meeting, delete_meeting,
+    upsert_meeting_notes, get_meeting_bundle,
+    add_action_item, get_open_action_items_grouped,
+    update_action_item_statuses_bulk, delete_action_items,
+    save_attachment_streaming, get_attachment_data, delete_attachment,
+    add_meeting_url, delete_meeting_url,
+    get_all_kb_articles, get_kb_category_counts, add_kb_article, delete_kb_article, update_kb_article,
+    TOKEN_RE,
 )
 from chatbot import chatbot_response
 
@@ -35,14 +43,34 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-init_db()
-seed_kb_articles()
+
+@st.cache_resource
+def _init_database():
+    """Create the schema and seed the KB once per server process, not on every rerun."""
+    init_db()
+    seed_kb_articles()
+
+
+_init_database()
+
+MONTH_NAMES = tuple(calendar.month_name)
+
+STATUS_OPTIONS = ("open", "in_progress", "completed")
+STATUS_INDEX = {s: i for i, s in enumerate(STATUS_OPTIONS)}
+MEETING_STATUS_OPTIONS = ("scheduled", "completed", "cancelled")
+MEETING_STATUS_INDEX = {s: i for i, s in enumerate(MEETING_STATUS_OPTIONS)}
+MEETING_STATUS_EMOJI = {"scheduled": "🟡", "completed": "🟢", "cancelled": "🔴"}
+STATUS_EMOJI = {"open": "🔴", "in_progress": "🟠", "completed": "🟢"}
+ITEM_MD = "{status_emoji} {description}{assignee_md}{due_md}"
 
 # ──────────────────────────────────────────────
 # CUSTOM CSS
 # ──────────────────────────────────────────────
 
-st.markdown("""
+@st.cache_resource
+def _page_css():
+    """Global stylesheet, built once per server process."""
+    return """
 <style>
     /* Global */
     .block-container { padding-top: 1rem; }
@@ -69,11 +97,6 @@ st.markdown("""
     .metric-card h3 { margin: 0; font-size: 1.5rem; }
     .metric-card p { margin: 0; font-size: 0.85rem; color: #666; }
 
-    /* Status badges */
-    .status-open { color: #d63031; font-weight: 600; }
-    .status-in_progress { color: #e17055; font-weight: 600; }
-    .status-completed { color: #00b894; font-weight: 600; }
-
     /* KB Article cards */
     .kb-card {
         background: white;
@@ -127,21 +150,108 @@ st.markdown("""
     }
     section[data-testid="stSidebar"] .stMarkdown { color: #e0e0e0; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def _hub_header(title, subtitle):
+    """Gradient page header HTML, built once per page."""
+    return f"""
+    <div class="hub-header">
+        <h1>{title}</h1>
+        <p>{subtitle}</p>
+    </div>
+    """
+
+
+st.markdown(_page_css(), unsafe_allow_html=True)
+
+
+# ──────────────────────────────────────────────
+# CACHED QUERIES
+# ──────────────────────────────────────────────
+
+@st.cache_data(ttl=300)
+def _cached_all_meetings():
+    """All meetings with notes, cached across reruns until a meeting mutation."""
+    return get_all_meetings()
+
+
+def _tags_to_html(tags):
+    """Comma-separated tags as kb-tag badge spans."""
+    if not tags:
+        return ""
+    return " ".join("<span class='kb-tag'>" + t.strip() + "</span>" for t in tags.split(","))
+
+
+@st.cache_data(ttl=300)
+def _kb_index():
+    """KB articles plus a sorted token vocabulary and token -> article-id postings.
+
+    Each article is copied with its rendered ``tags_html``, so the tag badges
+    are built once per index and the shared get_all_kb_articles() list is
+    left untouched.
+    """
+    articles = [dict(a, tags_html=_tags_to_html(a["tags"])) for a in get_all_kb_articles()]
+    postings = defaultdict(set)
+    for a in articles:
+        text = " ".join((a["title"], a["description"] or "", a["tags"] or "", a["category"]))
+        for tok in TOKEN_RE.findall(text.lower()):
+            postings[tok].add(a["id"])
+    return articles, sorted(postings), dict(postings)
+
+
+def _search_kb_index(query):
+    """Articles containing every query term as a word prefix, searched in memory."""
+    articles, vocab, postings = _kb_index()
+    matched = None
+    for term in TOKEN_RE.findall(query.lower()):
+        ids = set()
+        i = bisect_left(vocab, term)
+        while i < len(vocab) and vocab[i].startswith(term):
+            ids |= postings[vocab[i]]
+            i += 1
+        matched = ids if matched is None else matched & ids
+    if matched is None:
+        return articles
+    return [a for a in articles if a["id"] in matched]
+
+
+@st.cache_resource
+def _db_read_pool():
+    """Worker threads for independent read-only queries.
+
+    Long-lived so each worker keeps its own query-only SQLite connection; WAL
+    mode lets their reads run concurrently.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="db-read",
+                              initializer=make_connection_read_only)
+
+
+@st.cache_data(ttl=300)
+def _cached_meeting_bundle(meeting_id):
+    """Notes, items, attachment metadata and URLs for one meeting, shared by the notes-panel sections."""
+    return get_meeting_bundle(meeting_id)
+
+
+def _read_attachment(attachment_id):
+    """Attachment bytes for a download, read in one query when it is clicked."""
+    data = get_attachment_data(attachment_id)
+    return data["file_data"] if data else b""
 
 
 # ──────────────────────────────────────────────
 # SESSION STATE
 # ──────────────────────────────────────────────
 
-if "chat_history" not in st.session_state:
-    st.session_state.chat_history = []
-if "editing_meeting_id" not in st.session_state:
-    st.session_state.editing_meeting_id = None
-if "show_create_form" not in st.session_state:
-    st.session_state.show_create_form = False
-if "active_notes_meeting" not in st.session_state:
-    st.session_state.active_notes_meeting = None
+_SESSION_DEFAULTS = {
+    "chat_history": [],
+    "editing_meeting_id": None,
+    "show_create_form": False,
+    "active_notes_meeting": None,
+}
+for _key, _value in _SESSION_DEFAULTS.items():
+    st.session_state.setdefault(_key, _value)
 
 
 # ──────────────────────────────────────────────
@@ -163,6 +273,392 @@ with st.sidebar:
     )
 
 
+# ──────────────────────────────────────────────
+# WIDGET CALLBACKS
+# ──────────────────────────────────────────────
+# State flips run as on_click callbacks, so the click's own rerun already
+# sees the new state and no follow-up st.rerun() is needed.
+
+def _toggle_create_form():
+    st.session_state.show_create_form = not st.session_state.show_create_form
+    st.session_state.editing_meeting_id = None
+
+
+def _cancel_edit():
+    st.session_state.editing_meeting_id = None
+
+
+def _delete_kb_article(article_id):
+    delete_kb_article(article_id)
+    _kb_index.clear()
+
+
+def _submit_chat():
+    _process_chat(st.session_state.chat_prompt)
+
+
+def _clear_chat():
+    st.session_state.chat_history = []
+
+
+# ──────────────────────────────────────────────
+# MEETING CARD RENDERING
+# ──────────────────────────────────────────────
+
+def _rerun_fragment():
+    """Rerun only the calling fragment, or the whole app during a full-app run."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+
+@st.fragment
+def _render_meeting_card(mtg):
+    """Render a single meeting card with notes, action items, attachments.
+
+    Runs as a fragment so widgets in the notes panel only rerun this card.
+    Edit, delete, status changes and the notes toggle still call st.rerun()
+    because a callback here would only rerun the fragment, and they affect
+    the edit form, the month grouping or another card's open panel.
+    """
+    meeting_id = mtg["id"]
+    status_emoji = MEETING_STATUS_EMOJI.get(mtg["status"], "⚪")
+
+    with st.container(border=True):
+        # Header row
+        hc1, hc2, hc3 = st.columns([4, 2, 2])
+        with hc1:
+            st.markdown(f"### {status_emoji} {mtg['topic']}")
+        with hc2:
+            st.markdown(f"**📅** {mtg['meeting_date']}  •  **🕐** {mtg['meeting_time']}")
+        with hc3:
+            st.markdown(f"**🎤** {mtg['presenter']}")
+
+        if mtg["description"]:
+            st.markdown(f"_{mtg['description']}_")
+
+        if mtg["url"] and mtg["url_name"]:
+            st.markdown(f"🔗 [{mtg['url_name']}]({mtg['url']})")
+        elif mtg["url"]:
+            st.markdown(f"🔗 [Link]({mtg['url']})")
+
+        # Action buttons
+        bc1, bc2, bc3, bc4 = st.columns(4)
+        with bc1:
+            if st.button("✏️ Edit", key=f"edit_{meeting_id}"):
+                st.session_state.editing_meeting_id = meeting_id
+                st.session_state.show_create_form = False
+                st.rerun()
+        with bc2:
+            if st.button("🗑️ Delete", key=f"del_{meeting_id}"):
+                delete_meeting(meeting_id)
+                _cached_all_meetings.clear()
+                st.rerun()
+        with bc3:
+            if st.button("📝 Notes", key=f"notes_{meeting_id}"):
+                if st.session_state.active_notes_meeting == meeting_id:
+                    st.session_state.active_notes_meeting = None
+                else:
+                    st.session_state.active_notes_meeting = meeting_id
+                st.rerun()
+        with bc4:
+            status_toggle = "completed" if mtg["status"] != "completed" else "scheduled"
+            label = "✅ Mark Done" if status_toggle == "completed" else "🔄 Reopen"
+            if st.button(label, key=f"status_{meeting_id}"):
+                update_meeting(meeting_id, status=status_toggle)
+                _cached_all_meetings.clear()
+                st.rerun()
+
+        # ── NOTES PANEL ──
+        if st.session_state.active_notes_meeting == meeting_id:
+            _render_notes_panel(meeting_id)
+
+
+@st.fragment
+def _render_notes_panel(meeting_id):
+    """Render the notes, TODOs, action items, attachments, and URLs panel.
+
+    Only the selected section is rendered; every section reads the meeting's
+    cached bundle, which fetches all the panel data in one pass when the
+    panel first opens.
+    """
+    st.markdown("---")
+    section = st.radio(
+        "Section", list(NOTES_PANEL_SECTIONS),
+        key=f"notes_tab_{meeting_id}",
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+    NOTES_PANEL_SECTIONS[section](meeting_id)
+
+
+@st.fragment
+def _render_notes_tab(meeting_id):
+    """Meeting notes and attendee count form."""
+    existing_notes = _cached_meeting_bundle(meeting_id)["notes"]
+    with st.form(f"notes_form_{meeting_id}"):
+        notes_text = st.text_area(
+            "Meeting Notes",
+            value=existing_notes["notes"] if existing_notes else "",
+            height=200,
+            placeholder="Capture key discussion points, decisions, and insights...",
+        )
+        attendee_count = st.number_input(
+            "👥 Number of Attendees",
+            min_value=0, max_value=500,
+            value=existing_notes["attendee_count"] if existing_notes else 0,
+        )
+        if st.form_submit_button("💾 Save Notes", type="primary"):
+            upsert_meeting_notes(meeting_id, notes_text, attendee_count)
+            _cached_meeting_bundle.clear()
+            _cached_all_meetings.clear()
+            st.success("Notes saved!")
+            _rerun_fragment()
+
+
+def _render_todo_tab(meeting_id):
+    """TO DOs and action items side by side, each in its own fragment."""
+    tc1, tc2 = st.columns(2)
+    with tc1:
+        _render_todo_list(meeting_id)
+    with tc2:
+        _render_action_item_list(meeting_id)
+
+
+@st.fragment
+def _render_attachments_tab(meeting_id):
+    """Attachment list with downloads, plus the uploader."""
+    existing_attachments = _cached_meeting_bundle(meeting_id)["attachments"]
+    if existing_attachments:
+        for att in existing_attachments:
+            att_c1, att_c2, att_c3 = st.columns([4, 2, 1])
+            with att_c1:
+                st.markdown(f"📎 **{att['file_name']}**")
+            with att_c2:
+                size_kb = att["file_size"] / 1024
+                st.markdown(f"_{size_kb:.1f} KB_ • {att['file_type']}")
+            with att_c3:
+                # A callable defers reading the blob until the download is clicked
+                if att["file_size"]:
+                    st.download_button(
+                        "⬇️", data=partial(_read_attachment, att["id"]),
+                        file_name=att["file_name"],
+                        mime=att["file_type"],
+                        key=f"dl_att_{att['id']}",
+                    )
+                else:
+                    st.caption("empty file")
+
+    # A fresh uploader key after each batch clears the widget; otherwise the
+    # retained files would be saved again on every rerun.
+    upload_gen_key = f"upload_gen_{meeting_id}"
+    uploaded = st.file_uploader(
+        "Upload Attachment", key=f"upload_{meeting_id}_{st.session_state.get(upload_gen_key, 0)}",
+        accept_multiple_files=True,
+        help="Upload documents, images, or any relevant files."
+    )
+    if uploaded:
+        for f in uploaded:
+            save_attachment_streaming(meeting_id, f.name, f, f.type, f.size)
+        _cached_meeting_bundle.clear()
+        st.session_state[upload_gen_key] = st.session_state.get(upload_gen_key, 0) + 1
+        st.toast(f"Uploaded {len(uploaded)} file(s)!")
+        _rerun_fragment()
+
+
+@st.fragment
+def _render_urls_tab(meeting_id):
+    """Additional meeting URLs."""
+    existing_urls = _cached_meeting_bundle(meeting_id)["urls"]
+    for u in existing_urls:
+        uc1, uc2 = st.columns([5, 1])
+        with uc1:
+            st.markdown(f"🔗 [{u['url_name']}]({u['url']})")
+        with uc2:
+            if st.button("🗑️", key=f"del_url_{u['id']}"):
+                delete_meeting_url(u["id"])
+                _cached_meeting_bundle.clear()
+                _rerun_fragment()
+
+    with st.form(f"add_url_{meeting_id}"):
+        url_c1, url_c2 = st.columns(2)
+        with url_c1:
+            new_url_name = st.text_input("URL Label", placeholder="e.g., Recording Link")
+        with url_c2:
+            new_url = st.text_input("URL", placeholder="https://...")
+        if st.form_submit_button("➕ Add URL"):
+            if new_url_name and new_url:
+                add_meeting_url(meeting_id, new_url_name, new_url)
+                _cached_meeting_bundle.clear()
+                _rerun_fragment()
+
+
+@st.fragment
+def _render_todo_list(meeting_id):
+    """Render a meeting's TO DOs; edits here rerun only this list."""
+    st.markdown("**📋 TO DOs**")
+    todos = _cached_meeting_bundle(meeting_id)["todos"]
+    _render_item_status_form(todos, f"bulk_status_todo_{meeting_id}", "todo")
+
+    with st.form(f"add_todo_{meeting_id}"):
+        st.markdown("**Add TO DO**")
+        td_desc = st.text_input("Description", key=f"td_desc_{meeting_id}",
+                                placeholder="What needs to be done?")
+        td_assignee = st.text_input("Assignee", key=f"td_assign_{meeting_id}",
+                                    placeholder="Who's responsible?")
+        if st.form_submit_button("➕ Add TO DO"):
+            if td_desc:
+                add_action_item(meeting_id, "todo", td_desc, td_assignee)
+                _cached_meeting_bundle.clear()
+                _rerun_fragment()
+
+
+@st.fragment
+def _render_action_item_list(meeting_id):
+    """Render a meeting's action items; edits here rerun only this list."""
+    st.markdown("**🎯 Action Items**")
+    actions = _cached_meeting_bundle(meeting_id)["actions"]
+    _render_item_status_form(actions, f"bulk_status_ai_{meeting_id}", "ai")
+
+    with st.form(f"add_action_{meeting_id}"):
+        st.markdown("**Add Action Item**")
+        ai_desc = st.text_input("Description", key=f"ai_desc_{meeting_id}",
+                                placeholder="Action to be taken")
+        ai_c1, ai_c2 = st.columns(2)
+        with ai_c1:
+            ai_assignee = st.text_input("Assignee", key=f"ai_assign_{meeting_id}")
+        with ai_c2:
+            ai_due = st.date_input("Due Date", key=f"ai_due_{meeting_id}",
+                                   value=date.today() + timedelta(days=7))
+        if st.form_submit_button("➕ Add Action Item"):
+            if ai_desc:
+                add_action_item(meeting_id, "action_item", ai_desc,
+                                ai_assignee, ai_due.isoformat())
+                _cached_meeting_bundle.clear()
+                _rerun_fragment()
+
+
+def _render_item_status_form(items, form_key, key_prefix):
+    """Render item rows in one form so status edits and deletes apply in a single rerun."""
+    if not items:
+        return
+    with st.form(form_key):
+        new_statuses = {}
+        to_delete = []
+        for item in items:
+            ic1, ic2, ic3 = st.columns([4, 2, 1])
+            with ic1:
+                st.markdown(ITEM_MD.format_map({
+                    "status_emoji": STATUS_EMOJI[item["status"]],
+                    "description": item["description"],
+                    "assignee_md": f" — *{item['assignee']}*" if item["assignee"] else "",
+                    "due_md": f" (Due: {item['due_date']})" if item["due_date"] else "",
+                }))
+            with ic2:
+                new_statuses[item["id"]] = st.selectbox(
+                    "Status", STATUS_OPTIONS,
+                    index=STATUS_INDEX[item["status"]],
+                    key=f"{key_prefix}_status_{item['id']}",
+                    label_visibility="collapsed",
+                )
+            with ic3:
+                if st.checkbox("🗑️", key=f"del_{key_prefix}_{item['id']}", help="Delete on apply"):
+                    to_delete.append(item["id"])
+
+        if st.form_submit_button("💾 Apply changes"):
+            changed = [(item["id"], new_statuses[item["id"]]) for item in items
+                       if new_statuses[item["id"]] != item["status"] and item["id"] not in to_delete]
+            if changed:
+                update_action_item_statuses_bulk(changed)
+            if to_delete:
+                delete_action_items(to_delete)
+            if changed or to_delete:
+                _cached_meeting_bundle.clear()
+                _rerun_fragment()
+
+
+NOTES_PANEL_SECTIONS = {
+    "📝 Meeting Notes": _render_notes_tab,
+    "☑️ TODOs & Action Items": _render_todo_tab,
+    "📎 Attachments": _render_attachments_tab,
+    "🔗 URLs": _render_urls_tab,
+}
+
+
+# ──────────────────────────────────────────────
+# CHAT HELPERS
+# ──────────────────────────────────────────────
+
+def _process_chat(user_input):
+    """Process a chat message and get bot response.
+
+    Each entry stores its rendered bubble as ``_html`` and each article its
+    truncated ``_display_desc`` so redrawing the history doesn't rebuild every
+    past message.
+    """
+    st.session_state.chat_history.append({
+        "role": "user",
+        "content": user_input,
+        "_html": f"<div class='chat-user'>🧑 {user_input}</div>",
+    })
+    response = chatbot_response(user_input)
+    articles = []
+    for article in response["articles"]:
+        desc = article.get("description") or ""
+        articles.append({
+            "id": article["id"],
+            "title": article["title"],
+            "url": article["url"],
+            "source_type": article["source_type"],
+            "_display_desc": desc if len(desc) <= 120 else f"{desc[:120]}...",
+        })
+    st.session_state.chat_history.append({
+        "role": "bot",
+        "message": response["message"],
+        "articles": articles,
+        "suggestions": response["suggestions"],
+        "_html": f"<div class='chat-bot'>🤖 {response['message']}</div>",
+    })
+
+
+@st.fragment
+def _render_chat_history():
+    """Render the chat transcript; suggestion clicks rerun only this fragment."""
+    with st.container(height=450):
+        if not st.session_state.chat_history:
+            st.markdown("""
+            **👋 Welcome to the SRE Knowledge Assistant!**
+
+            I can help you find internal Confluence pages and external SRE resources.
+            Try asking things like:
+            - *"How do I respond to a P1 incident?"*
+            - *"Where's our chaos engineering playbook?"*
+            - *"Show me Kubernetes troubleshooting guides"*
+            """)
+
+        for entry_idx, entry in enumerate(st.session_state.chat_history):
+            st.markdown(entry["_html"], unsafe_allow_html=True)
+            if entry["role"] == "user":
+                continue
+
+            # Display articles
+            for article in entry.get("articles", []):
+                badge = "📘" if article["source_type"] == "confluence" else "🌐"
+                st.markdown(f"  {badge} **[{article['title']}]({article['url']})**")
+                if article["_display_desc"]:
+                    st.markdown(f"  _{article['_display_desc']}_")
+
+            # Display suggestions
+            if entry.get("suggestions"):
+                st.markdown("**💡 Related searches:**")
+                suggestion_cols = st.columns(min(len(entry["suggestions"]), 4))
+                for idx, sug in enumerate(entry["suggestions"][:4]):
+                    with suggestion_cols[idx]:
+                        st.button(f"🔍 {sug}", key=f"sug_{entry_idx}_{idx}",
+                                  on_click=_process_chat, args=(sug,))
+
+
 # ══════════════════════════════════════════════
 # PAGE: MEETING AGENDAS
 # ══════════════════════════════════════════════
@@ -170,19 +666,17 @@ with st.sidebar:
 if page == "📋 Meeting Agendas":
 
     # Header
-    st.markdown("""
-    <div class="hub-header">
-        <h1>📋 Meeting Agendas</h1>
-        <p>Create, manage, and track SRE community meetings with notes, action items, and attachments</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _hub_header("📋 Meeting Agendas",
+                    "Create, manage, and track SRE community meetings with notes, action items, and attachments"),
+        unsafe_allow_html=True,
+    )
 
     # ── Create / Edit Meeting Form ──
     col_btn1, col_btn2 = st.columns([1, 5])
     with col_btn1:
-        if st.button("➕ New Meeting", type="primary", use_container_width=True):
-            st.session_state.show_create_form = not st.session_state.show_create_form
-            st.session_state.editing_meeting_id = None
+        st.button("➕ New Meeting", type="primary", use_container_width=True,
+                  on_click=_toggle_create_form)
 
     # CREATE FORM
     if st.session_state.show_create_form and st.session_state.editing_meeting_id is None:
@@ -215,6 +709,7 @@ if page == "📋 Meeting Agendas":
                             url_name=m_url_name,
                             url=m_url,
                         )
+                        _cached_all_meetings.clear()
                         st.success(f"✅ Meeting '{m_topic}' created!")
                         st.session_state.show_create_form = False
                         st.rerun()
@@ -230,7 +725,7 @@ if page == "📋 Meeting Agendas":
                     with ec1:
                         e_date = st.date_input("📅 Date", value=date.fromisoformat(meeting["meeting_date"]))
                         e_topic = st.text_input("📌 Topic", value=meeting["topic"])
-                        e_url_name = st.text_input("🔗 URL Label", value=meeting.get("url_name", ""))
+                        e_url_name = st.text_input("🔗 URL Label", value=meeting["url_name"])
                     with ec2:
                         try:
                             parsed_time = datetime.strptime(meeting["meeting_time"], "%I:%M %p").time()
@@ -238,17 +733,16 @@ if page == "📋 Meeting Agendas":
                             parsed_time = time(10, 0)
                         e_time = st.time_input("🕐 Time", value=parsed_time)
                         e_presenter = st.text_input("🎤 Presenter", value=meeting["presenter"])
-                        e_url = st.text_input("🌐 URL", value=meeting.get("url", ""))
-                    e_desc = st.text_area("📝 Description", value=meeting.get("description", ""), height=80)
-                    e_status = st.selectbox("Status", ["scheduled", "completed", "cancelled"],
-                                            index=["scheduled", "completed", "cancelled"].index(
-                                                meeting.get("status", "scheduled")))
+                        e_url = st.text_input("🌐 URL", value=meeting["url"])
+                    e_desc = st.text_area("📝 Description", value=meeting["description"], height=80)
+                    e_status = st.selectbox("Status", MEETING_STATUS_OPTIONS,
+                                            index=MEETING_STATUS_INDEX[meeting["status"]])
 
                     ec_save, ec_cancel = st.columns(2)
                     with ec_save:
                         save_btn = st.form_submit_button("💾 Save Changes", type="primary")
                     with ec_cancel:
-                        cancel_btn = st.form_submit_button("❌ Cancel")
+                        st.form_submit_button("❌ Cancel", on_click=_cancel_edit)
 
                     if save_btn:
                         update_meeting(
@@ -262,260 +756,27 @@ if page == "📋 Meeting Agendas":
                             url=e_url,
                             status=e_status,
                         )
+                        _cached_all_meetings.clear()
                         st.success("✅ Meeting updated!")
                         st.session_state.editing_meeting_id = None
                         st.rerun()
-                    if cancel_btn:
-                        st.session_state.editing_meeting_id = None
-                        st.rerun()
 
     # ── Display Meetings Grouped by Month ──
     st.markdown("---")
-    meetings = get_all_meetings()
+    meetings = _cached_all_meetings()
 
     if not meetings:
         st.info("📭 No meetings yet. Click **➕ New Meeting** to get started!")
     else:
-        # Group by month
-        monthly = defaultdict(list)
-        for m in meetings:
-            try:
-                d = date.fromisoformat(m["meeting_date"])
-                key = f"{calendar.month_name[d.month]} {d.year}"
-            except (ValueError, TypeError):
-                key = "Unknown Date"
-            monthly[key].append(m)
-
-        for month_label, month_meetings in monthly.items():
+        # Group by month — rows arrive date-ordered with a SQL-computed "YYYY-MM" key
+        for ym, group in itertools.groupby(meetings, key=itemgetter("ym")):
+            month_label = f"{MONTH_NAMES[int(ym[5:])]} {ym[:4]}" if ym else "Unknown Date"
+            month_meetings = list(group)
             with st.expander(f"📅 **{month_label}** — {len(month_meetings)} meeting(s)", expanded=True):
                 for mtg in month_meetings:
                     _render_meeting_card(mtg)
 
 
-def _render_meeting_card(mtg):
-    """Render a single meeting card with notes, action items, attachments."""
-    meeting_id = mtg["id"]
-    status_emoji = {"scheduled": "🟡", "completed": "🟢", "cancelled": "🔴"}.get(mtg.get("status", ""), "⚪")
-
-    with st.container(border=True):
-        # Header row
-        hc1, hc2, hc3 = st.columns([4, 2, 2])
-        with hc1:
-            st.markdown(f"### {status_emoji} {mtg['topic']}")
-        with hc2:
-            st.markdown(f"**📅** {mtg['meeting_date']}  •  **🕐** {mtg['meeting_time']}")
-        with hc3:
-            st.markdown(f"**🎤** {mtg['presenter']}")
-
-        if mtg.get("description"):
-            st.markdown(f"_{mtg['description']}_")
-
-        if mtg.get("url") and mtg.get("url_name"):
-            st.markdown(f"🔗 [{mtg['url_name']}]({mtg['url']})")
-        elif mtg.get("url"):
-            st.markdown(f"🔗 [Link]({mtg['url']})")
-
-        # Action buttons
-        bc1, bc2, bc3, bc4 = st.columns(4)
-        with bc1:
-            if st.button("✏️ Edit", key=f"edit_{meeting_id}"):
-                st.session_state.editing_meeting_id = meeting_id
-                st.session_state.show_create_form = False
-                st.rerun()
-        with bc2:
-            if st.button("🗑️ Delete", key=f"del_{meeting_id}"):
-                delete_meeting(meeting_id)
-                st.rerun()
-        with bc3:
-            notes_key = f"notes_{meeting_id}"
-            if st.button("📝 Notes", key=notes_key):
-                if st.session_state.active_notes_meeting == meeting_id:
-                    st.session_state.active_notes_meeting = None
-                else:
-                    st.session_state.active_notes_meeting = meeting_id
-                st.rerun()
-        with bc4:
-            status_toggle = "completed" if mtg.get("status") != "completed" else "scheduled"
-            label = "✅ Mark Done" if status_toggle == "completed" else "🔄 Reopen"
-            if st.button(label, key=f"status_{meeting_id}"):
-                update_meeting(meeting_id, status=status_toggle)
-                st.rerun()
-
-        # ── NOTES PANEL ──
-        if st.session_state.active_notes_meeting == meeting_id:
-            _render_notes_panel(meeting_id)
-
-
-def _render_notes_panel(meeting_id):
-    """Render the notes, TODOs, action items, attachments, and URLs panel."""
-    st.markdown("---")
-    notes_tab, todo_tab, attach_tab, urls_tab = st.tabs(
-        ["📝 Meeting Notes", "☑️ TODOs & Action Items", "📎 Attachments", "🔗 URLs"]
-    )
-
-    # ── Meeting Notes Tab ──
-    with notes_tab:
-        existing_notes = get_meeting_notes(meeting_id)
-        with st.form(f"notes_form_{meeting_id}"):
-            notes_text = st.text_area(
-                "Meeting Notes",
-                value=existing_notes.get("notes", "") if existing_notes else "",
-                height=200,
-                placeholder="Capture key discussion points, decisions, and insights...",
-            )
-            attendee_count = st.number_input(
-                "👥 Number of Attendees",
-                min_value=0, max_value=500,
-                value=existing_notes.get("attendee_count", 0) if existing_notes else 0,
-            )
-            if st.form_submit_button("💾 Save Notes", type="primary"):
-                upsert_meeting_notes(meeting_id, notes_text, attendee_count)
-                st.success("Notes saved!")
-                st.rerun()
-
-    # ── TODOs & Action Items Tab ──
-    with todo_tab:
-        tc1, tc2 = st.columns(2)
-
-        with tc1:
-            st.markdown("**📋 TO DOs**")
-            todos = get_action_items(meeting_id, "todo")
-            for item in todos:
-                ic1, ic2, ic3 = st.columns([4, 2, 1])
-                with ic1:
-                    status_class = f"status-{item['status']}"
-                    st.markdown(
-                        f"<span class='{status_class}'>●</span> {item['description']}"
-                        + (f" — *{item['assignee']}*" if item.get("assignee") else ""),
-                        unsafe_allow_html=True,
-                    )
-                with ic2:
-                    new_status = st.selectbox(
-                        "Status", ["open", "in_progress", "completed"],
-                        index=["open", "in_progress", "completed"].index(item["status"]),
-                        key=f"todo_status_{item['id']}",
-                        label_visibility="collapsed",
-                    )
-                    if new_status != item["status"]:
-                        update_action_item_status(item["id"], new_status)
-                        st.rerun()
-                with ic3:
-                    if st.button("🗑️", key=f"del_todo_{item['id']}"):
-                        delete_action_item(item["id"])
-                        st.rerun()
-
-            with st.form(f"add_todo_{meeting_id}"):
-                st.markdown("**Add TO DO**")
-                td_desc = st.text_input("Description", key=f"td_desc_{meeting_id}",
-                                        placeholder="What needs to be done?")
-                td_assignee = st.text_input("Assignee", key=f"td_assign_{meeting_id}",
-                                            placeholder="Who's responsible?")
-                if st.form_submit_button("➕ Add TO DO"):
-                    if td_desc:
-                        add_action_item(meeting_id, "todo", td_desc, td_assignee)
-                        st.rerun()
-
-        with tc2:
-            st.markdown("**🎯 Action Items**")
-            actions = get_action_items(meeting_id, "action_item")
-            for item in actions:
-                ac1, ac2, ac3 = st.columns([4, 2, 1])
-                with ac1:
-                    status_class = f"status-{item['status']}"
-                    due = f" (Due: {item['due_date']})" if item.get("due_date") else ""
-                    st.markdown(
-                        f"<span class='{status_class}'>●</span> {item['description']}"
-                        + (f" — *{item['assignee']}*" if item.get("assignee") else "")
-                        + due,
-                        unsafe_allow_html=True,
-                    )
-                with ac2:
-                    new_status = st.selectbox(
-                        "Status", ["open", "in_progress", "completed"],
-                        index=["open", "in_progress", "completed"].index(item["status"]),
-                        key=f"ai_status_{item['id']}",
-                        label_visibility="collapsed",
-                    )
-                    if new_status != item["status"]:
-                        update_action_item_status(item["id"], new_status)
-                        st.rerun()
-                with ac3:
-                    if st.button("🗑️", key=f"del_ai_{item['id']}"):
-                        delete_action_item(item["id"])
-                        st.rerun()
-
-            with st.form(f"add_action_{meeting_id}"):
-                st.markdown("**Add Action Item**")
-                ai_desc = st.text_input("Description", key=f"ai_desc_{meeting_id}",
-                                        placeholder="Action to be taken")
-                ai_c1, ai_c2 = st.columns(2)
-                with ai_c1:
-                    ai_assignee = st.text_input("Assignee", key=f"ai_assign_{meeting_id}")
-                with ai_c2:
-                    ai_due = st.date_input("Due Date", key=f"ai_due_{meeting_id}",
-                                           value=date.today() + timedelta(days=7))
-                if st.form_submit_button("➕ Add Action Item"):
-                    if ai_desc:
-                        add_action_item(meeting_id, "action_item", ai_desc,
-                                        ai_assignee, ai_due.isoformat())
-                        st.rerun()
-
-    # ── Attachments Tab ──
-    with attach_tab:
-        existing_attachments = get_attachments(meeting_id)
-        if existing_attachments:
-            for att in existing_attachments:
-                att_c1, att_c2, att_c3 = st.columns([4, 2, 1])
-                with att_c1:
-                    st.markdown(f"📎 **{att['file_name']}**")
-                with att_c2:
-                    size_kb = (att.get("file_size", 0) or 0) / 1024
-                    st.markdown(f"_{size_kb:.1f} KB_ • {att.get('file_type', 'N/A')}")
-                with att_c3:
-                    # Download button
-                    att_data = get_attachment_data(att["id"])
-                    if att_data and att_data.get("file_data"):
-                        st.download_button(
-                            "⬇️", data=att_data["file_data"],
-                            file_name=att_data["file_name"],
-                            mime=att_data.get("file_type", "application/octet-stream"),
-                            key=f"dl_att_{att['id']}",
-                        )
-
-        uploaded = st.file_uploader(
-            "Upload Attachment", key=f"upload_{meeting_id}",
-            accept_multiple_files=True,
-            help="Upload documents, images, or any relevant files."
-        )
-        if uploaded:
-            for f in uploaded:
-                save_attachment(meeting_id, f.name, f.read(), f.type, f.size)
-            st.success(f"Uploaded {len(uploaded)} file(s)!")
-            st.rerun()
-
-    # ── URLs Tab ──
-    with urls_tab:
-        existing_urls = get_meeting_urls(meeting_id)
-        for u in existing_urls:
-            uc1, uc2 = st.columns([5, 1])
-            with uc1:
-                st.markdown(f"🔗 [{u['url_name']}]({u['url']})")
-            with uc2:
-                if st.button("🗑️", key=f"del_url_{u['id']}"):
-                    delete_meeting_url(u["id"])
-                    st.rerun()
-
-        with st.form(f"add_url_{meeting_id}"):
-            url_c1, url_c2 = st.columns(2)
-            with url_c1:
-                new_url_name = st.text_input("URL Label", placeholder="e.g., Recording Link")
-            with url_c2:
-                new_url = st.text_input("URL", placeholder="https://...")
-            if st.form_submit_button("➕ Add URL"):
-                if new_url_name and new_url:
-                    add_meeting_url(meeting_id, new_url_name, new_url)
-                    st.rerun()
-
 
 # ══════════════════════════════════════════════
 # PAGE: KNOWLEDGE BASE
@@ -523,12 +784,11 @@ def _render_notes_panel(meeting_id):
 
 elif page == "📖 Knowledge Base":
 
-    st.markdown("""
-    <div class="hub-header">
-        <h1>📖 Knowledge Base</h1>
-        <p>Internal Confluence pages and external SRE resources — searchable and organized by category</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _hub_header("📖 Knowledge Base",
+                    "Internal Confluence pages and external SRE resources — searchable and organized by category"),
+        unsafe_allow_html=True,
+    )
 
     # Search bar
     kb_search = st.text_input("🔍 Search articles...", placeholder="e.g., incident, kubernetes, monitoring")
@@ -553,23 +813,17 @@ elif page == "📖 Knowledge Base":
             if st.form_submit_button("✅ Add Article", type="primary"):
                 if kb_title and kb_url:
                     add_kb_article(kb_title, kb_category, kb_desc, kb_url, kb_source, kb_tags)
+                    _kb_index.clear()
                     st.success(f"Added: {kb_title}")
                     st.rerun()
                 else:
                     st.error("Title and URL are required.")
 
     # Display articles
-    articles = get_all_kb_articles()
-    if kb_search:
-        from chatbot import search_kb_articles
-        articles = search_kb_articles(kb_search)
-
-    # Group by category
-    by_category = defaultdict(list)
-    for a in articles:
-        by_category[a["category"]].append(a)
+    articles = _search_kb_index(kb_search)
 
-    for cat, cat_articles in sorted(by_category.items()):
+    # Rows arrive sorted by category, so groups stream straight from the list
+    for cat, cat_articles in itertools.groupby(articles, key=itemgetter("category")):
         st.markdown(f"### 📂 {cat}")
         for article in cat_articles:
             with st.container(border=True):
@@ -582,18 +836,13 @@ elif page == "📖 Knowledge Base":
                         f"<span class='{badge_class}'>{badge_label}</span>",
                         unsafe_allow_html=True,
                     )
-                    if article.get("description"):
+                    if article["description"]:
                         st.markdown(f"_{article['description']}_")
-                    if article.get("tags"):
-                        tags_html = " ".join(
-                            f"<span class='kb-tag'>{t.strip()}</span>"
-                            for t in article["tags"].split(",")
-                        )
-                        st.markdown(tags_html, unsafe_allow_html=True)
+                    if article["tags_html"]:
+                        st.markdown(article["tags_html"], unsafe_allow_html=True)
                 with ac2:
-                    if st.button("🗑️", key=f"del_kb_{article['id']}"):
-                        delete_kb_article(article["id"])
-                        st.rerun()
+                    st.button("🗑️", key=f"del_kb_{article['id']}",
+                              on_click=_delete_kb_article, args=(article["id"],))
 
 
 # ══════════════════════════════════════════════
@@ -602,79 +851,23 @@ elif page == "📖 Knowledge Base":
 
 elif page == "💬 KB Chatbot":
 
-    st.markdown("""
-    <div class="hub-header">
-        <h1>💬 SRE Knowledge Assistant</h1>
-        <p>Ask questions in plain language — I'll find the right Confluence page or resource for you</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _hub_header("💬 SRE Knowledge Assistant",
+                    "Ask questions in plain language — I'll find the right Confluence page or resource for you"),
+        unsafe_allow_html=True,
+    )
 
     # Chat history display
-    chat_container = st.container(height=450)
-    with chat_container:
-        if not st.session_state.chat_history:
-            st.markdown("""
-            **👋 Welcome to the SRE Knowledge Assistant!**
-
-            I can help you find internal Confluence pages and external SRE resources.
-            Try asking things like:
-            - *"How do I respond to a P1 incident?"*
-            - *"Where's our chaos engineering playbook?"*
-            - *"Show me Kubernetes troubleshooting guides"*
-            """)
-
-        for entry in st.session_state.chat_history:
-            if entry["role"] == "user":
-                st.markdown(
-                    f"<div class='chat-user'>🧑 {entry['content']}</div>",
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.markdown(
-                    f"<div class='chat-bot'>🤖 {entry['message']}</div>",
-                    unsafe_allow_html=True,
-                )
-                # Display articles
-                for article in entry.get("articles", []):
-                    badge = "📘" if article.get("source_type") == "confluence" else "🌐"
-                    st.markdown(f"  {badge} **[{article['title']}]({article['url']})**")
-                    if article.get("description"):
-                        st.markdown(f"  _{article['description'][:120]}..._" if len(article.get("description", "")) > 120 else f"  _{article['description']}_")
-
-                # Display suggestions
-                if entry.get("suggestions"):
-                    st.markdown("**💡 Related searches:**")
-                    suggestion_cols = st.columns(min(len(entry["suggestions"]), 4))
-                    for idx, sug in enumerate(entry["suggestions"][:4]):
-                        with suggestion_cols[idx]:
-                            if st.button(f"🔍 {sug}", key=f"sug_{len(st.session_state.chat_history)}_{idx}"):
-                                _process_chat(sug)
-                                st.rerun()
+    _render_chat_history()
 
     # Input
-    user_input = st.chat_input("Ask about any SRE topic...")
-    if user_input:
-        _process_chat(user_input)
-        st.rerun()
+    st.chat_input("Ask about any SRE topic...", key="chat_prompt", on_submit=_submit_chat)
 
     # Clear chat
     if st.session_state.chat_history:
-        if st.button("🗑️ Clear Chat"):
-            st.session_state.chat_history = []
-            st.rerun()
+        st.button("🗑️ Clear Chat", on_click=_clear_chat)
 
 
-def _process_chat(user_input):
-    """Process a chat message and get bot response."""
-    st.session_state.chat_history.append({"role": "user", "content": user_input})
-    response = chatbot_response(user_input)
-    st.session_state.chat_history.append({
-        "role": "bot",
-        "message": response["message"],
-        "articles": response["articles"],
-        "suggestions": response["suggestions"],
-    })
-
 
 # ══════════════════════════════════════════════
 # PAGE: DASHBOARD
@@ -682,20 +875,26 @@ def _process_chat(user_input):
 
 elif page == "📊 Dashboard":
 
-    st.markdown("""
-    <div class="hub-header">
-        <h1>📊 Dashboard</h1>
-        <p>At-a-glance metrics for your SRE meetings, action items, and knowledge base</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _hub_header("📊 Dashboard",
+                    "At-a-glance metrics for your SRE meetings, action items, and knowledge base"),
+        unsafe_allow_html=True,
+    )
 
-    meetings = get_all_meetings()
-    all_articles = get_all_kb_articles()
+    # Uncached reads run on the pool while the cached lists load here
+    pool = _db_read_pool()
+    open_items_future = pool.submit(get_open_action_items_grouped)
+    upcoming_future = pool.submit(get_upcoming_meetings, date.today().isoformat(), 5)
+    kb_counts_future = pool.submit(get_kb_category_counts)
+    meetings = _cached_all_meetings()
+    open_by_meeting = open_items_future.result()
+    upcoming = upcoming_future.result()
+    kb_counts = kb_counts_future.result()
 
     # Summary metrics
     total_meetings = len(meetings)
-    completed = sum(1 for m in meetings if m.get("status") == "completed")
-    scheduled = sum(1 for m in meetings if m.get("status") == "scheduled")
+    completed = sum(1 for m in meetings if m["status"] == "completed")
+    scheduled = sum(1 for m in meetings if m["status"] == "scheduled")
 
     mc1, mc2, mc3, mc4 = st.columns(4)
     with mc1:
@@ -716,36 +915,29 @@ elif page == "📊 Dashboard":
     with mc4:
         st.markdown(f"""
         <div class="metric-card" style="border-color: #6c5ce7;">
-            <h3>{len(all_articles)}</h3><p>KB Articles</p>
+            <h3>{sum(n for _, n in kb_counts)}</h3><p>KB Articles</p>
         </div>""", unsafe_allow_html=True)
 
     st.markdown("---")
 
     # Open action items across all meetings
     st.subheader("🎯 Open Action Items Across All Meetings")
-    has_open = False
-    for mtg in meetings:
-        items = get_action_items(mtg["id"])
-        open_items = [i for i in items if i["status"] != "completed"]
-        if open_items:
-            has_open = True
-            st.markdown(f"**{mtg['topic']}** ({mtg['meeting_date']})")
-            for item in open_items:
-                status_emoji = "🔴" if item["status"] == "open" else "🟠"
-                assignee = f" → {item['assignee']}" if item.get("assignee") else ""
-                due = f" (Due: {item['due_date']})" if item.get("due_date") else ""
-                st.markdown(f"  {status_emoji} {item['description']}{assignee}{due}")
-    if not has_open:
+    for open_items in open_by_meeting.values():
+        st.markdown(f"**{open_items[0]['topic']}** ({open_items[0]['meeting_date']})")
+        for item in open_items:
+            status_emoji = STATUS_EMOJI[item["status"]]
+            assignee = f" → {item['assignee']}" if item["assignee"] else ""
+            due = f" (Due: {item['due_date']})" if item["due_date"] else ""
+            st.markdown(f"  {status_emoji} {item['description']}{assignee}{due}")
+    if not open_by_meeting:
         st.success("🎉 No open action items — everything is on track!")
 
     st.markdown("---")
 
     # Upcoming meetings
     st.subheader("📅 Upcoming Meetings")
-    today = date.today().isoformat()
-    upcoming = [m for m in meetings if m.get("meeting_date", "") >= today and m.get("status") == "scheduled"]
     if upcoming:
-        for m in upcoming[:5]:
+        for m in upcoming:
             st.markdown(f"• **{m['topic']}** — {m['meeting_date']} at {m['meeting_time']} (🎤 {m['presenter']})")
     else:
         st.info("No upcoming meetings scheduled.")
@@ -753,10 +945,7 @@ elif page == "📊 Dashboard":
     # KB coverage
     st.markdown("---")
     st.subheader("📚 Knowledge Base Coverage")
-    by_cat = defaultdict(int)
-    for a in all_articles:
-        by_cat[a["category"]] += 1
-    if by_cat:
+    if kb_counts:
         import pandas as pd
-        df = pd.DataFrame(list(by_cat.items()), columns=["Category", "Articles"])
+        df = pd.DataFrame(kb_counts, columns=["Category", "Articles"])
         st.bar_chart(df.set_index("Category"))
@@ -4,9 +4,16 @@ Provides intelligent search and conversational routing to KB articles.
 Uses fuzzy keyword matching and category-aware ranking.
 """
 
-from database import search_kb_articles, get_all_kb_articles
-from difflib import SequenceMatcher
-from typing import List, Dict
+import heapq
+import itertools
+import re
+from operator import itemgetter
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from database import search_kb_articles, get_all_kb_articles, TOKEN_RE
+from typing import List, Dict, Optional
 
 
 # ──────────────────────────────────────────────
@@ -36,50 +43,91 @@ GREETINGS = {"hello", "hi", "hey", "good morning", "good afternoon", "howdy", "s
 HELP_PATTERNS = {"help", "what can you do", "how does this work", "commands", "guide me"}
 
 
-def classify_intent(query: str) -> List[str]:
-    """Classify user query into one or more SRE domains."""
-    query_lower = query.lower()
-    matched = []
-    for intent, keywords in INTENT_MAP.items():
-        for kw in keywords:
-            if kw.lower() in query_lower:
-                matched.append(intent)
-                break
-    return matched
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation that reports every (overlapping) hit.
 
+    Longer keywords come first so a keyword nested in another at the same
+    position doesn't shadow it; the lookahead lets matches overlap.
+    """
+    alternatives = sorted({kw.lower() for kw in keywords}, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, alternatives)) + "))")
 
-def fuzzy_score(query: str, text: str) -> float:
-    """Compute a combined relevance score using substring + sequence matching."""
-    query_lower = query.lower()
-    text_lower = text.lower()
 
-    # Direct substring bonus
-    substring_score = 0
-    for word in query_lower.split():
-        if word in text_lower:
-            substring_score += 0.3
+def _phrase_pattern(phrases) -> re.Pattern:
+    """Compile phrases into one alternation that only matches whole words."""
+    alternatives = sorted({p.lower() for p in phrases}, key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, alternatives)) + r")\b")
+
 
-    # Sequence similarity
-    seq_score = SequenceMatcher(None, query_lower, text_lower).ratio()
+# keyword -> intents it signals ("alert" belongs to more than one)
+_INTENT_KEYWORDS: Dict[str, List[str]] = {}
+for _intent, _keywords in INTENT_MAP.items():
+    for _kw in _keywords:
+        _INTENT_KEYWORDS.setdefault(_kw.lower(), []).append(_intent)
 
-    return min(1.0, substring_score + seq_score)
+INTENT_RE = _keyword_pattern(_INTENT_KEYWORDS)
+# Whole-word so e.g. "hi" in "crashing" or "sup" in "support" isn't a greeting
+GREETING_RE = _phrase_pattern(GREETINGS)
+HELP_RE = _phrase_pattern(HELP_PATTERNS)
 
 
-def rank_articles(query: str, articles: List[Dict]) -> List[Dict]:
-    """Rank articles by relevance to the query using multi-signal scoring."""
-    scored = []
-    for article in articles:
-        # Score across multiple fields
-        title_score = fuzzy_score(query, article.get("title", "")) * 2.0  # Title weighted 2x
-        desc_score = fuzzy_score(query, article.get("description", "")) * 1.5
-        tag_score = fuzzy_score(query, article.get("tags", "")) * 1.8
-        cat_score = fuzzy_score(query, article.get("category", "")) * 1.2
+def classify_intent(query: str) -> List[str]:
+    """Classify user query into one or more SRE domains."""
+    found = set()
+    for match in INTENT_RE.finditer(query.lower()):
+        found.update(_INTENT_KEYWORDS[match.group(1)])
+    return [intent for intent in INTENT_MAP if intent in found]
 
-        total = title_score + desc_score + tag_score + cat_score
-        scored.append((total, article))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [item[1] for item in scored if item[0] > 0.5]
+# Field weights for ranking (title weighted highest). Integer tenths
+# (2.0, 1.5, 1.8, 1.2) so fuzzy scores stay in integer arithmetic.
+RANK_FIELD_WEIGHTS = (("title", 20), ("description", 15), ("tags", 18), ("category", 12))
+RANK_SCORE_CUTOFF = 50  # per-field WRatio below this counts as no match
+RANK_MIN_TOTAL = 500  # sum of weight * WRatio; 0.5 on the 0-1 score scale
+RANK_RERANK_POOL = 20  # articles kept by word overlap before fuzzy scoring
+
+
+def _token_overlap(query_tokens: frozenset, article: Dict) -> float:
+    """Weighted Jaccard similarity between the query words and each field's words."""
+    return sum(
+        weight * len(query_tokens & article[f"_{field}_tokens"])
+        / (len(query_tokens | article[f"_{field}_tokens"]) or 1)
+        for field, weight in RANK_FIELD_WEIGHTS
+    )
+
+
+def rank_articles(query: str, articles: List[Dict], limit: Optional[int] = None) -> List[Dict]:
+    """Rank articles by weighted fuzzy relevance to the query, best first.
+
+    Articles need the ``_<col>_lc``/``_<col>_tokens`` fields added by
+    get_all_kb_articles(). ``limit`` caps how many are returned (all matches
+    when None); with a limit, large corpora are first narrowed to the
+    articles sharing the most words with the query.
+    """
+    if not articles:
+        return []
+    query_lc = query.lower()
+
+    pool = articles
+    if limit is not None and len(articles) > RANK_RERANK_POOL:
+        query_tokens = frozenset(TOKEN_RE.findall(query_lc))
+        overlaps = [(o, i) for i, a in enumerate(articles) if (o := _token_overlap(query_tokens, a)) > 0]
+        if len(overlaps) >= limit:
+            kept = heapq.nlargest(RANK_RERANK_POOL, overlaps, key=itemgetter(0))
+            pool = [articles[i] for i in sorted(i for _, i in kept)]
+
+    totals = np.zeros(len(pool), dtype=np.int32)
+    for field, weight in RANK_FIELD_WEIGHTS:
+        scores = process.cdist(
+            [query_lc], [a[f"_{field}_lc"] for a in pool],
+            scorer=fuzz.WRatio,
+            score_cutoff=RANK_SCORE_CUTOFF, dtype=np.uint8,
+        )[0]
+        totals += weight * scores.astype(np.int32)
+
+    candidates = np.flatnonzero(totals > RANK_MIN_TOTAL)
+    top = candidates[np.argsort(-totals[candidates], kind="stable")][:limit]
+    return [pool[i] for i in top]
 
 
 def chatbot_response(user_input: str) -> Dict:
@@ -94,6 +142,7 @@ def chatbot_response(user_input: str) -> Dict:
         }
     """
     query = user_input.strip()
+    query_lower = query.lower()
 
     # Handle empty input
     if not query:
@@ -104,7 +153,7 @@ def chatbot_response(user_input: str) -> Dict:
         }
 
     # Handle greetings
-    if query.lower() in GREETINGS or any(g in query.lower() for g in GREETINGS):
+    if GREETING_RE.search(query_lower):
         return {
             "message": (
                 "👋 Hey there! I'm the SRE Knowledge Base assistant. "
@@ -122,7 +171,7 @@ def chatbot_response(user_input: str) -> Dict:
         }
 
     # Handle help requests
-    if any(h in query.lower() for h in HELP_PATTERNS):
+    if HELP_RE.search(query_lower):
         return {
             "message": (
                 "🔍 **I can help you find SRE resources!**\n\n"
@@ -142,23 +191,14 @@ def chatbot_response(user_input: str) -> Dict:
             ]
         }
 
-    # Search KB articles
-    db_results = search_kb_articles(query)
-
-    # Also get all articles for fuzzy ranking
-    all_articles = get_all_kb_articles()
-    ranked = rank_articles(query, all_articles)
-
-    # Merge: DB results first (exact matches), then ranked fuzzy matches
-    seen_ids = set()
-    merged = []
-    for article in db_results + ranked:
-        if article["id"] not in seen_ids:
-            seen_ids.add(article["id"])
-            merged.append(article)
+    # Full-text search (BM25-ranked in SQLite)
+    top_results = search_kb_articles(query, limit=5)
 
-    # Limit to top 5
-    top_results = merged[:5]
+    # Top up with fuzzy ranking when the index finds few hits (e.g. typos);
+    # keying by id dedupes while keeping the FTS hits first
+    if len(top_results) < 5:
+        ranked = rank_articles(query, get_all_kb_articles(), limit=5)
+        top_results = list({a["id"]: a for a in itertools.chain(top_results, ranked)}.values())[:5]
 
     # Classify intent for suggestions
     intents = classify_intent(query)
@@ -1,29 +1,129 @@
 """
 SRE Meeting Hub - Database Layer
 Handles all CRUD operations for meetings, notes, KB articles using SQLite.
+
+Read helpers return sqlite3.Row objects (name and index access) unless their
+results are cached by the app or merged with cached KB articles (search);
+those return dicts.
 """
 
 import sqlite3
+import itertools
 import json
 import os
-from datetime import datetime, date
+import re
+import threading
+from operator import itemgetter
 from typing import Optional
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "sre_meeting_hub.db")
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024  # 1 MiB per incremental BLOB write
+
+
+_local = threading.local()
+
+# Per-connection settings, applied in one script when a connection opens.
+# journal_mode=WAL persists in the database file, so init_db sets it once.
+CONNECTION_PRAGMAS = """
+    PRAGMA foreign_keys=ON;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA mmap_size=268435456;  -- 256 MiB: memory-map reads instead of read()
+    PRAGMA cache_size=-64000;    -- ~64 MB page cache
+    PRAGMA temp_store=MEMORY;
+"""
 
 
 def get_connection():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    """Return this thread's SQLite connection, opening it on first use.
+
+    The connection stays open for reuse across calls on the same thread;
+    callers don't close it and wrap writes in ``with conn:`` to commit or roll
+    back. Streamlit runs each rerun on a new script thread, so the app reuses
+    it only within one script run (and for the life of the dashboard's
+    read-pool workers); it is dropped with its thread.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != DB_PATH:
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(CONNECTION_PRAGMAS)
+        _local.conn, _local.path = conn, DB_PATH
     return conn
 
 
+def make_connection_read_only():
+    """Set this thread's connection to refuse writes (for read-only workers)."""
+    get_connection().execute("PRAGMA query_only=1")
+
+
+# UPDATE statements by (table, sorted columns). Reusing the exact SQL text
+# lets sqlite3's per-connection statement cache skip re-preparing it.
+_UPDATE_SQL = {}
+
+
+def _update_sql(table, columns, touch_updated_at=False):
+    key = (table, columns, touch_updated_at)
+    sql = _UPDATE_SQL.get(key)
+    if sql is None:
+        assignments = [f"{col} = ?" for col in columns]
+        if touch_updated_at:
+            assignments.append("updated_at = CURRENT_TIMESTAMP")
+        sql = _UPDATE_SQL[key] = f"UPDATE {table} SET {', '.join(assignments)} WHERE id = ?"
+    return sql
+
+
+# Full-text index over kb_articles, kept in sync by triggers
+KB_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS kb_fts USING fts5(
+        title, description, tags, category,
+        content='kb_articles', content_rowid='id',
+        tokenize='porter unicode61'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS kb_articles_ai AFTER INSERT ON kb_articles BEGIN
+        INSERT INTO kb_fts(rowid, title, description, tags, category)
+        VALUES (new.id, new.title, new.description, new.tags, new.category);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS kb_articles_ad AFTER DELETE ON kb_articles BEGIN
+        INSERT INTO kb_fts(kb_fts, rowid, title, description, tags, category)
+        VALUES ('delete', old.id, old.title, old.description, old.tags, old.category);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS kb_articles_au AFTER UPDATE ON kb_articles BEGIN
+        INSERT INTO kb_fts(kb_fts, rowid, title, description, tags, category)
+        VALUES ('delete', old.id, old.title, old.description, old.tags, old.category);
+        INSERT INTO kb_fts(rowid, title, description, tags, category)
+        VALUES (new.id, new.title, new.description, new.tags, new.category);
+    END;
+"""
+
+
+def _fts5_available():
+    """Whether this SQLite build provides the FTS5 module."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(x)")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+
 def init_db():
     """Initialize database schema with all required tables."""
     conn = get_connection()
+    conn.execute("PRAGMA journal_mode=WAL")
     cursor = conn.cursor()
+    fts_exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'kb_fts'"
+    ).fetchone() is not None
 
     cursor.executescript("""
         CREATE TABLE IF NOT EXISTS meetings (
@@ -96,10 +196,15 @@ def init_db():
         CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings(meeting_date);
         CREATE INDEX IF NOT EXISTS idx_action_items_meeting ON action_items(meeting_id);
         CREATE INDEX IF NOT EXISTS idx_kb_tags ON kb_articles(tags);
+        CREATE INDEX IF NOT EXISTS idx_kb_category ON kb_articles(category);
     """)
 
-    conn.commit()
-    conn.close()
+    if FTS5_AVAILABLE:
+        cursor.executescript(KB_FTS_SCHEMA)
+        # Backfill the index for databases created before it existed
+        if not fts_exists:
+            with conn:
+                conn.execute("INSERT INTO kb_fts(kb_fts) VALUES ('rebuild')")
 
 
 # ──────────────────────────────────────────────
@@ -109,15 +214,14 @@ def init_db():
 def create_meeting(meeting_date, meeting_time, topic, presenter,
                    description="", url_name="", url=""):
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO meetings (meeting_date, meeting_time, topic, presenter,
-                              description, url_name, url)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (meeting_date, meeting_time, topic, presenter, description, url_name, url))
-    meeting_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO meetings (meeting_date, meeting_time, topic, presenter,
+                                  description, url_name, url)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (meeting_date, meeting_time, topic, presenter, description, url_name, url))
+        meeting_id = cursor.lastrowid
     return meeting_id
 
 
@@ -126,42 +230,49 @@ def get_all_meetings():
     rows = conn.execute("""
         SELECT m.*,
                mn.notes, mn.attendee_count,
-               mn.id as notes_id
+               mn.id as notes_id,
+               strftime('%Y-%m', m.meeting_date) as ym
         FROM meetings m
         LEFT JOIN meeting_notes mn ON m.id = mn.meeting_id
         ORDER BY m.meeting_date DESC, m.meeting_time DESC
     """).fetchall()
-    conn.close()
     return [dict(r) for r in rows]
 
 
+def get_upcoming_meetings(from_date, limit=5):
+    """Scheduled meetings on or after from_date (ISO date), soonest first."""
+    conn = get_connection()
+    rows = conn.execute("""
+        SELECT * FROM meetings
+        WHERE meeting_date >= ? AND status = 'scheduled'
+        ORDER BY meeting_date, meeting_time
+        LIMIT ?
+    """, (from_date, limit)).fetchall()
+    return rows
+
+
 def get_meeting(meeting_id):
     conn = get_connection()
     row = conn.execute("SELECT * FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
-    conn.close()
-    return dict(row) if row else None
+    return row
 
 
 def update_meeting(meeting_id, **kwargs):
-    conn = get_connection()
     allowed = {"meeting_date", "meeting_time", "topic", "presenter",
                "description", "url_name", "url", "status"}
-    fields = {k: v for k, v in kwargs.items() if k in allowed}
-    if not fields:
+    columns = tuple(sorted(k for k in kwargs if k in allowed))
+    if not columns:
         return
-    fields["updated_at"] = datetime.now().isoformat()
-    set_clause = ", ".join(f"{k} = ?" for k in fields)
-    values = list(fields.values()) + [meeting_id]
-    conn.execute(f"UPDATE meetings SET {set_clause} WHERE id = ?", values)
-    conn.commit()
-    conn.close()
+    values = [kwargs[col] for col in columns] + [meeting_id]
+    conn = get_connection()
+    with conn:
+        conn.execute(_update_sql("meetings", columns, touch_updated_at=True), values)
 
 
 def delete_meeting(meeting_id):
     conn = get_connection()
-    conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
 
 
 # ──────────────────────────────────────────────
@@ -170,22 +281,21 @@ def delete_meeting(meeting_id):
 
 def upsert_meeting_notes(meeting_id, notes="", attendee_count=0):
     conn = get_connection()
-    existing = conn.execute(
-        "SELECT id FROM meeting_notes WHERE meeting_id = ?", (meeting_id,)
-    ).fetchone()
-    if existing:
-        conn.execute("""
-            UPDATE meeting_notes
-            SET notes = ?, attendee_count = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE meeting_id = ?
-        """, (notes, attendee_count, meeting_id))
-    else:
-        conn.execute("""
-            INSERT INTO meeting_notes (meeting_id, notes, attendee_count)
-            VALUES (?, ?, ?)
-        """, (meeting_id, notes, attendee_count))
-    conn.commit()
-    conn.close()
+    with conn:
+        existing = conn.execute(
+            "SELECT id FROM meeting_notes WHERE meeting_id = ?", (meeting_id,)
+        ).fetchone()
+        if existing:
+            conn.execute("""
+                UPDATE meeting_notes
+                SET notes = ?, attendee_count = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE meeting_id = ?
+            """, (notes, attendee_count, meeting_id))
+        else:
+            conn.execute("""
+                INSERT INTO meeting_notes (meeting_id, notes, attendee_count)
+                VALUES (?, ?, ?)
+            """, (meeting_id, notes, attendee_count))
 
 
 def get_meeting_notes(meeting_id):
@@ -193,8 +303,44 @@ def get_meeting_notes(meeting_id):
     row = conn.execute(
         "SELECT * FROM meeting_notes WHERE meeting_id = ?", (meeting_id,)
     ).fetchone()
-    conn.close()
-    return dict(row) if row else None
+    return row
+
+
+# A meeting's attachment metadata, without the file bytes; shared by
+# get_meeting_bundle and get_attachments.
+ATTACHMENT_METADATA_SQL = """
+    SELECT id, meeting_id, file_name, file_type,
+           COALESCE(file_size, length(file_data), 0) AS file_size, uploaded_at
+    FROM attachments WHERE meeting_id = ?
+"""
+
+
+def get_meeting_bundle(meeting_id):
+    """Fetch everything the notes panel shows for a meeting over one connection.
+
+    Returns {"notes", "todos", "actions", "attachments", "urls"}; attachment
+    entries carry metadata only, not the file bytes.
+    """
+    conn = get_connection()
+    notes = conn.execute(
+        "SELECT * FROM meeting_notes WHERE meeting_id = ?", (meeting_id,)
+    ).fetchone()
+    items = conn.execute(
+        "SELECT * FROM action_items WHERE meeting_id = ? ORDER BY id", (meeting_id,)
+    ).fetchall()
+    attachments = conn.execute(
+        ATTACHMENT_METADATA_SQL, (meeting_id,)
+    ).fetchall()
+    urls = conn.execute(
+        "SELECT * FROM meeting_urls WHERE meeting_id = ?", (meeting_id,)
+    ).fetchall()
+    return {
+        "notes": dict(notes) if notes else None,
+        "todos": [dict(r) for r in items if r["item_type"] == "todo"],
+        "actions": [dict(r) for r in items if r["item_type"] == "action_item"],
+        "attachments": [dict(r) for r in attachments],
+        "urls": [dict(r) for r in urls],
+    }
 
 
 # ──────────────────────────────────────────────
@@ -203,14 +349,13 @@ def get_meeting_notes(meeting_id):
 
 def add_action_item(meeting_id, item_type, description, assignee="", due_date=None):
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO action_items (meeting_id, item_type, description, assignee, due_date)
-        VALUES (?, ?, ?, ?, ?)
-    """, (meeting_id, item_type, description, assignee, due_date))
-    item_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO action_items (meeting_id, item_type, description, assignee, due_date)
+            VALUES (?, ?, ?, ?, ?)
+        """, (meeting_id, item_type, description, assignee, due_date))
+        item_id = cursor.lastrowid
     return item_id
 
 
@@ -226,22 +371,55 @@ def get_action_items(meeting_id, item_type=None):
             "SELECT * FROM action_items WHERE meeting_id = ? ORDER BY item_type, id",
             (meeting_id,)
         ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return rows
+
+
+def get_open_action_items_grouped():
+    """Fetch all non-completed action items with their meeting, grouped by meeting id.
+
+    Rows of one meeting arrive contiguous, so they are bucketed in a single
+    groupby pass; the dict keeps the newest-meeting-first order.
+    """
+    conn = get_connection()
+    rows = conn.execute("""
+        SELECT a.*, m.topic, m.meeting_date
+        FROM action_items a
+        JOIN meetings m ON a.meeting_id = m.id
+        WHERE a.status != 'completed'
+        ORDER BY m.meeting_date DESC, m.meeting_time DESC, a.meeting_id, a.item_type, a.id
+    """).fetchall()
+    return {
+        meeting_id: list(items)
+        for meeting_id, items in itertools.groupby(rows, key=itemgetter("meeting_id"))
+    }
 
 
 def update_action_item_status(item_id, status):
     conn = get_connection()
-    conn.execute("UPDATE action_items SET status = ? WHERE id = ?", (status, item_id))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("UPDATE action_items SET status = ? WHERE id = ?", (status, item_id))
 
 
 def delete_action_item(item_id):
     conn = get_connection()
-    conn.execute("DELETE FROM action_items WHERE id = ?", (item_id,))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("DELETE FROM action_items WHERE id = ?", (item_id,))
+
+
+def update_action_item_statuses_bulk(pairs):
+    """Apply several (item_id, status) changes in one transaction."""
+    conn = get_connection()
+    with conn:
+        conn.executemany(
+            "UPDATE action_items SET status = ? WHERE id = ?",
+            [(status, item_id) for item_id, status in pairs]
+        )
+
+
+def delete_action_items(item_ids):
+    conn = get_connection()
+    with conn:
+        conn.executemany("DELETE FROM action_items WHERE id = ?", [(i,) for i in item_ids])
 
 
 # ──────────────────────────────────────────────
@@ -250,25 +428,46 @@ def delete_action_item(item_id):
 
 def save_attachment(meeting_id, file_name, file_data, file_type, file_size):
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO attachments (meeting_id, file_name, file_data, file_type, file_size)
-        VALUES (?, ?, ?, ?, ?)
-    """, (meeting_id, file_name, file_data, file_type, file_size))
-    att_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO attachments (meeting_id, file_name, file_data, file_type, file_size)
+            VALUES (?, ?, ?, ?, ?)
+        """, (meeting_id, file_name, file_data, file_type, file_size))
+        att_id = cursor.lastrowid
+    return att_id
+
+
+def save_attachment_streaming(meeting_id, file_name, file_obj, file_type, file_size):
+    """Save an attachment by copying a file-like object into the BLOB in chunks.
+
+    The row is inserted with a zeroblob() placeholder of the final size and then
+    filled through SQLite's incremental blob I/O, so the file is never held as
+    a second full-size bytes object. Falls back to save_attachment() on Python
+    versions without Connection.blobopen (< 3.11).
+    """
+    conn = get_connection()
+    if not hasattr(conn, "blobopen"):
+        return save_attachment(meeting_id, file_name, file_obj.read(), file_type, file_size)
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO attachments (meeting_id, file_name, file_data, file_type, file_size)
+            VALUES (?, ?, zeroblob(?), ?, ?)
+        """, (meeting_id, file_name, file_size, file_type, file_size))
+        att_id = cursor.lastrowid
+        with conn.blobopen("attachments", "file_data", att_id) as blob:
+            while chunk := file_obj.read(ATTACHMENT_CHUNK_SIZE):
+                blob.write(chunk)
     return att_id
 
 
 def get_attachments(meeting_id):
     conn = get_connection()
     rows = conn.execute(
-        "SELECT id, meeting_id, file_name, file_type, file_size, uploaded_at FROM attachments WHERE meeting_id = ?",
-        (meeting_id,)
+        ATTACHMENT_METADATA_SQL, (meeting_id,)
     ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return rows
 
 
 def get_attachment_data(attachment_id):
@@ -277,15 +476,13 @@ def get_attachment_data(attachment_id):
         "SELECT file_name, file_data, file_type FROM attachments WHERE id = ?",
         (attachment_id,)
     ).fetchone()
-    conn.close()
-    return dict(row) if row else None
+    return row
 
 
 def delete_attachment(attachment_id):
     conn = get_connection()
-    conn.execute("DELETE FROM attachments WHERE id = ?", (attachment_id,))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("DELETE FROM attachments WHERE id = ?", (attachment_id,))
 
 
 # ──────────────────────────────────────────────
@@ -294,13 +491,12 @@ def delete_attachment(attachment_id):
 
 def add_meeting_url(meeting_id, url_name, url):
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO meeting_urls (meeting_id, url_name, url) VALUES (?, ?, ?)
-    """, (meeting_id, url_name, url))
-    url_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO meeting_urls (meeting_id, url_name, url) VALUES (?, ?, ?)
+        """, (meeting_id, url_name, url))
+        url_id = cursor.lastrowid
     return url_id
 
 
@@ -309,84 +505,140 @@ def get_meeting_urls(meeting_id):
     rows = conn.execute(
         "SELECT * FROM meeting_urls WHERE meeting_id = ?", (meeting_id,)
     ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return rows
 
 
 def delete_meeting_url(url_id):
     conn = get_connection()
-    conn.execute("DELETE FROM meeting_urls WHERE id = ?", (url_id,))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("DELETE FROM meeting_urls WHERE id = ?", (url_id,))
 
 
 # ──────────────────────────────────────────────
 # KNOWLEDGE BASE ARTICLES
 # ──────────────────────────────────────────────
 
+# In-memory copy of the KB; writers bump "version" so the next read reloads
+_KB_CACHE = {"version": 0, "loaded": -1, "rows": None}
+# Columns that also get a lowercased "_<col>_lc" copy for case-insensitive
+# matching and a "_<col>_tokens" word set for overlap scoring
+KB_LC_FIELDS = ("title", "description", "tags", "category")
+TOKEN_RE = re.compile(r"\w+")
+
+
+def _invalidate_kb_cache():
+    _KB_CACHE["version"] += 1
+
+
 def add_kb_article(title, category, description, url, source_type="confluence", tags=""):
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO kb_articles (title, category, description, url, source_type, tags)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (title, category, description, url, source_type, tags))
-    article_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO kb_articles (title, category, description, url, source_type, tags)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (title, category, description, url, source_type, tags))
+        article_id = cursor.lastrowid
+    _invalidate_kb_cache()
     return article_id
 
 
 def get_all_kb_articles():
+    """All KB articles, served from memory until the KB is next modified.
+
+    Each article also carries ``_<col>_lc`` lowercased copies and
+    ``_<col>_tokens`` word sets of the KB_LC_FIELDS columns. The returned
+    list is shared between callers; treat it as read-only.
+    """
+    version = _KB_CACHE["version"]
+    if _KB_CACHE["loaded"] != version:
+        conn = get_connection()
+        rows = conn.execute("SELECT * FROM kb_articles ORDER BY category COLLATE NOCASE, category, title").fetchall()
+        articles = []
+        for r in rows:
+            article = dict(r)
+            for col in KB_LC_FIELDS:
+                lc = (article[col] or "").lower()
+                article[f"_{col}_lc"] = lc
+                article[f"_{col}_tokens"] = frozenset(TOKEN_RE.findall(lc))
+            articles.append(article)
+        _KB_CACHE.update(rows=articles, loaded=version)
+    return _KB_CACHE["rows"]
+
+
+def get_kb_category_counts():
+    """(category, article count) pairs, ordered by category."""
     conn = get_connection()
-    rows = conn.execute("SELECT * FROM kb_articles ORDER BY category, title").fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    rows = conn.execute(
+        "SELECT category, COUNT(*) FROM kb_articles GROUP BY category ORDER BY category"
+    ).fetchall()
+    return [tuple(r) for r in rows]
 
 
-def search_kb_articles(query):
-    """Keyword search across title, description, tags, and category."""
-    conn = get_connection()
-    terms = query.lower().split()
+def search_kb_articles(query, limit=50):
+    """Full-text search across title, description, tags, and category.
+
+    Matches any query term and orders hits by BM25, weighting the columns
+    like the chatbot's fuzzy ranking (title 2.0, description 1.5, tags 1.8,
+    category 1.2). Without FTS5 it falls back to a substring scan.
+    """
+    terms = TOKEN_RE.findall(query.lower())
     if not terms:
-        return get_all_kb_articles()
+        return []
+    if not FTS5_AVAILABLE:
+        return _search_kb_articles_like(terms, limit)
 
+    match = " OR ".join(f'"{term}"' for term in terms)
+    conn = get_connection()
+    rows = conn.execute("""
+        SELECT a.*
+        FROM kb_fts
+        JOIN kb_articles a ON a.id = kb_fts.rowid
+        WHERE kb_fts MATCH ?
+        ORDER BY bm25(kb_fts, 2.0, 1.5, 1.8, 1.2)
+        LIMIT ?
+    """, (match, limit)).fetchall()
+    return [dict(r) for r in rows]
+
+
+def _search_kb_articles_like(terms, limit):
+    """Substring search for SQLite builds without FTS5.
+
+    LIKE is already case-insensitive for ASCII, so the columns are compared
+    as stored rather than through LOWER().
+    """
     conditions = []
     params = []
     for term in terms:
-        conditions.append(
-            "(LOWER(title) LIKE ? OR LOWER(description) LIKE ? "
-            "OR LOWER(tags) LIKE ? OR LOWER(category) LIKE ?)"
-        )
-        wildcard = f"%{term}%"
-        params.extend([wildcard] * 4)
+        conditions.append("(title LIKE ? OR description LIKE ? OR tags LIKE ? OR category LIKE ?)")
+        params.extend([f"%{term}%"] * 4)
 
-    where = " OR ".join(conditions)
+    conn = get_connection()
     rows = conn.execute(
-        f"SELECT * FROM kb_articles WHERE {where} ORDER BY category, title", params
+        f"SELECT * FROM kb_articles WHERE {' OR '.join(conditions)} "
+        "ORDER BY category COLLATE NOCASE, category, title LIMIT ?",
+        params + [limit]
     ).fetchall()
-    conn.close()
     return [dict(r) for r in rows]
 
 
 def delete_kb_article(article_id):
     conn = get_connection()
-    conn.execute("DELETE FROM kb_articles WHERE id = ?", (article_id,))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("DELETE FROM kb_articles WHERE id = ?", (article_id,))
+    _invalidate_kb_cache()
 
 
 def update_kb_article(article_id, **kwargs):
-    conn = get_connection()
     allowed = {"title", "category", "description", "url", "source_type", "tags"}
-    fields = {k: v for k, v in kwargs.items() if k in allowed}
-    if not fields:
+    columns = tuple(sorted(k for k in kwargs if k in allowed))
+    if not columns:
         return
-    set_clause = ", ".join(f"{k} = ?" for k in fields)
-    values = list(fields.values()) + [article_id]
-    conn.execute(f"UPDATE kb_articles SET {set_clause} WHERE id = ?", values)
-    conn.commit()
-    conn.close()
+    values = [kwargs[col] for col in columns] + [article_id]
+    conn = get_connection()
+    with conn:
+        conn.execute(_update_sql("kb_articles", columns), values)
+    _invalidate_kb_cache()
 
 
 # ──────────────────────────────────────────────
@@ -398,7 +650,6 @@ def seed_kb_articles():
     conn = get_connection()
     count = conn.execute("SELECT COUNT(*) FROM kb_articles").fetchone()[0]
     if count > 0:
-        conn.close()
         return
 
     articles = [
@@ -464,10 +715,18 @@ def seed_kb_articles():
          "postmortem,blameless,RCA,root-cause,timeline,action-items"),
     ]
 
-    cursor = conn.cursor()
-    cursor.executemany("""
-        INSERT INTO kb_articles (title, category, description, url, source_type, tags)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, articles)
-    conn.commit()
-    conn.close()
+    # One write transaction for the whole batch, with fsyncs skipped for
+    # its commit; BEGIN IMMEDIATE also keeps two first runs from both seeding.
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    conn.execute("PRAGMA synchronous=OFF")
+    try:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("SELECT COUNT(*) FROM kb_articles").fetchone()[0] == 0:
+                conn.executemany("""
+                    INSERT INTO kb_articles (title, category, description, url, source_type, tags)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, articles)
+    finally:
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+    _invalidate_kb_cache()